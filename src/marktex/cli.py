@@ -1,39 +1,44 @@
 #!/usr/bin/env python3
 """Command-line interface for MarkTeX."""
 
-import argparse
-import shutil
-import subprocess
+import functools
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Literal
 
+# Heavier stdlib modules (argparse, shutil, subprocess, ...) are
+# imported at point of use to keep CLI startup latency low.
 
-def check_dependencies() -> tuple[bool, list[str]]:
+
+@functools.lru_cache(maxsize=1)
+def check_dependencies() -> tuple[bool, tuple[str, ...]]:
     """Check if required external dependencies are installed.
 
+    The result is cached: PATH does not change within a single
+    invocation, so repeated calls are free.
+
     Returns:
         Tuple of (all_found, missing_dependencies)
     """
-    missing = []
+    import concurrent.futures
+    import shutil
 
-    # Check for pandoc
-    if subprocess.run(["which", "pandoc"], capture_output=True).returncode != 0:
-        missing.append("pandoc")
+    # Mermaid rendering is handled by the bundled marktex-mermaid
+    # filter, which only needs mmdc
+    tools = [
+        ("pandoc", "pandoc"),
+        ("tectonic", "tectonic (install via: curl --proto '=https' --tlsv1.2 -fsSL https://drop-sh.fullyjustified.net | sh)"),
+        ("mmdc", "mmdc (install via: npm install -g @mermaid-js/mermaid-cli)"),
+    ]
 
-    # Check for pandoc-mermaid filter
-    if subprocess.run(["which", "pandoc-mermaid"], capture_output=True).returncode != 0:
-        missing.append("pandoc-mermaid (install via: uv tool install --from pandoc-mermaid-filter pandoc-mermaid-filter)")
+    # Each probe is an independent PATH walk, so overlap them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        found = executor.map(shutil.which, [name for name, _ in tools])
 
-    # Check for tectonic
-    if subprocess.run(["which", "tectonic"], capture_output=True).returncode != 0:
-        missing.append("tectonic (install via: curl --proto '=https' --tlsv1.2 -fsSL https://drop-sh.fullyjustified.net | sh)")
+    missing = [hint for (_, hint), path in zip(tools, found) if path is None]
 
-    # Check for mmdc (mermaid-cli)
-    if subprocess.run(["which", "mmdc"], capture_output=True).returncode != 0:
-        missing.append("mmdc (install via: npm install -g @mermaid-js/mermaid-cli)")
-
-    return len(missing) == 0, missing
+    return len(missing) == 0, tuple(missing)
 
 
 def determine_source_type(file_path: Path) -> str:
@@ -63,57 +68,90 @@ def determine_source_type(file_path: Path) -> str:
         raise ValueError(f"Unsupported file type: {file_path.suffix}")
 
 
+# Maps a resolved directory (as a string) to its repo root (or None),
+# so batch runs over many files only probe each ancestor chain once.
+_repo_root_cache: dict[str, Optional[Path]] = {}
+
+
 def find_repo_root(start_path: Path) -> Optional[Path]:
     """Find the repository root by looking for PDF/, TEX/, or .git folders.
 
+    Results are cached per directory, including every intermediate
+    ancestor visited, so later lookups from sibling paths are O(1).
+
     Args:
         start_path: Path to start searching from
 
     Returns:
         Repository root path if found, None otherwise
     """
-    current = start_path.resolve()
+    # All ancestors come from one parts tuple; candidates stay plain
+    # strings until a result is returned, instead of allocating a new
+    # Path object per level via .parent
+    parts = start_path.resolve().parts
+
+    # Walk up the directory tree (the filesystem root is never a repo)
+    visited = []
+    result = None
+    for i in range(len(parts), 1, -1):
+        candidate = os.path.join(*parts[:i])
+        if candidate in _repo_root_cache:
+            result = _repo_root_cache[candidate]
+            break
+        visited.append(candidate)
+        # Check for markers of repo root: one directory read instead of
+        # three separate stat calls
+        try:
+            names = {entry.name for entry in os.scandir(candidate)}
+        except OSError:
+            names = set()
+        if names & {"PDF", "TEX", ".git"}:
+            result = Path(candidate)
+            break
 
-    # Walk up the directory tree
-    while current != current.parent:
-        # Check for markers of repo root
-        if (current / "PDF").exists() or (current / "TEX").exists() or (current / ".git").exists():
-            return current
-        current = current.parent
+    for directory in visited:
+        _repo_root_cache[directory] = result
+
+    return result
 
-    return None
+
+# Top-level folders stripped when mirroring paths
+_SKIP = frozenset({'PDF', 'TEX', 'recent'})
 
 
 def get_relative_path_from_root(file_path: Path, repo_root: Path) -> Path:
     """Get the relative path of a file from the repo root, excluding PDF/TEX/recent folders.
 
+    Both arguments must already be resolved; main() resolves them once
+    so this stays syscall-free.
+
     Args:
-        file_path: Absolute path to the file
-        repo_root: Repository root path
+        file_path: Resolved absolute path to the file
+        repo_root: Resolved repository root path
 
     Returns:
         Relative path from repo root, excluding special folders
     """
-    try:
-        rel_path = file_path.resolve().relative_to(repo_root.resolve())
-        parts = list(rel_path.parts)
+    # Cheap predicate instead of raising and catching ValueError
+    if not file_path.is_relative_to(repo_root):
+        return file_path
 
-        # Remove PDF, TEX, or recent from the path if present
-        if parts and parts[0] in ('PDF', 'TEX', 'recent'):
-            parts = parts[1:]
+    parts = file_path.relative_to(repo_root).parts
 
-        return Path(*parts) if parts else Path('.')
-    except ValueError:
-        # File is not relative to repo_root
-        return file_path
+    # Remove PDF, TEX, or recent from the path if present; slice
+    # the parts tuple directly instead of materializing a list
+    if parts and parts[0] in _SKIP:
+        parts = parts[1:]
+
+    return Path(*parts) if parts else Path('.')
 
 
 def get_mirror_paths(source_file: Path, repo_root: Optional[Path]) -> dict[str, Optional[Path]]:
     """Get mirrored paths for PDF and TEX outputs.
 
     Args:
-        source_file: Path to the source markdown file
-        repo_root: Repository root path (None for simple mode)
+        source_file: Resolved path to the source markdown file
+        repo_root: Resolved repository root path (None for simple mode)
 
     Returns:
         Dictionary with 'pdf', 'tex', and 'recent' paths
@@ -141,6 +179,90 @@ def get_mirror_paths(source_file: Path, repo_root: Optional[Path]) -> dict[str,
     }
 
 
+def _needs_rebuild(src: Path, dst: Path) -> bool:
+    """Check whether dst is missing or out of date relative to src.
+
+    Mirrors the Make convention: a target is stale if it does not exist
+    or any prerequisite is newer. Freshly rendered mermaid diagrams also
+    count as prerequisites.
+
+    Args:
+        src: Source (prerequisite) file
+        dst: Target file
+
+    Returns:
+        True if dst needs to be rebuilt
+    """
+    if not dst.exists():
+        return True
+
+    dst_mtime = dst.stat().st_mtime
+    if src.stat().st_mtime > dst_mtime:
+        return True
+
+    # Diagrams rendered by pandoc-mermaid are inputs too
+    mermaid_dir = Path.cwd() / "mermaid-images"
+    if mermaid_dir.exists() and mermaid_dir.stat().st_mtime > dst_mtime:
+        return True
+
+    return False
+
+
+# Invariant pandoc argument prefixes, built once instead of per call.
+# marktex-mermaid is our bundled filter; it caches rendered diagrams by
+# content hash so unchanged diagrams cost nothing on re-runs.
+_PANDOC_TEX_ARGS = (
+    "pandoc",
+    "--from=markdown",
+    "--to=latex",
+    "--standalone",
+    "--filter", "marktex-mermaid",
+)
+_PANDOC_PDF_ARGS = (
+    "pandoc",
+    "--from=markdown",
+    "--filter", "marktex-mermaid",
+    # Use the engine we actually check for (pandoc defaults to
+    # pdflatex, which is not part of our dependency set) and keep the
+    # direct route on the same XeTeX-class engine as the compile path
+    "--pdf-engine=tectonic",
+)
+
+
+def _run_quiet(cmd, cwd: Optional[Path] = None) -> tuple[int, list[str]]:
+    """Run a command, discarding stdout and keeping only the tail of stderr.
+
+    Unlike capture_output=True, this never buffers the full output in
+    memory: stdout goes straight to /dev/null and stderr is consumed
+    line-by-line into a bounded deque.
+
+    Args:
+        cmd: Command argument list
+        cwd: Working directory for the command (optional)
+
+    Returns:
+        Tuple of (returncode, last stderr lines)
+    """
+    import collections
+    import subprocess
+
+    tail: collections.deque[str] = collections.deque(maxlen=200)
+
+    process = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    assert process.stderr is not None
+    for line in process.stderr:
+        tail.append(line)
+
+    return process.wait(), list(tail)
+
+
 def convert_md_to_tex(input_md: Path, output_tex: Path) -> bool:
     """Convert Markdown to LaTeX using Pandoc with Mermaid filter.
 
@@ -156,35 +278,26 @@ def convert_md_to_tex(input_md: Path, output_tex: Path) -> bool:
     # Ensure output directory exists
     output_tex.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
-        subprocess.run(
-            [
-                "pandoc",
-                str(input_md),
-                "--from=markdown",
-                "--to=latex",
-                "--standalone",
-                "--filter", "pandoc-mermaid",
-                "-o", str(output_tex)
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(f"  ✓ LaTeX: {output_tex}")
-        return True
-    except subprocess.CalledProcessError as e:
+    # subprocess accepts PathLike arguments directly; no need to
+    # stringify the paths ourselves
+    returncode, stderr_tail = _run_quiet(_PANDOC_TEX_ARGS + (input_md, "-o", output_tex))
+    if returncode != 0:
         print(f"  ✗ Error converting Markdown to LaTeX:", file=sys.stderr)
-        print(e.stderr, file=sys.stderr)
+        sys.stderr.writelines(stderr_tail)
         return False
 
+    print(f"  ✓ LaTeX: {output_tex}")
+    return True
+
 
-def convert_md_to_pdf_direct(input_md: Path, output_pdf: Path) -> bool:
+def convert_md_to_pdf_direct(input_md: Path, output_pdf: Path, quiet: bool = False) -> bool:
     """Convert Markdown directly to PDF using Pandoc (skip intermediate TEX).
 
     Args:
         input_md: Path to input Markdown file
         output_pdf: Path to output PDF file
+        quiet: Suppress the error block on failure (used when the
+            caller is going to fall back to another route)
 
     Returns:
         True if conversion succeeded, False otherwise
@@ -194,33 +307,32 @@ def convert_md_to_pdf_direct(input_md: Path, output_pdf: Path) -> bool:
     # Ensure output directory exists
     output_pdf.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
-        subprocess.run(
-            [
-                "pandoc",
-                str(input_md),
-                "--from=markdown",
-                "--filter", "pandoc-mermaid",
-                "-o", str(output_pdf)
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(f"  ✓ PDF: {output_pdf}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"  ✗ Error converting Markdown to PDF:", file=sys.stderr)
-        print(e.stderr, file=sys.stderr)
+    # Render to a temp name and publish with an atomic rename: pandoc
+    # rewrites -o targets in place, and the recent/ hardlinks rely on
+    # PDF outputs always being fresh inodes
+    tmp_pdf = output_pdf.with_name(f".{output_pdf.stem}.{os.getpid()}.pdf")
+    returncode, stderr_tail = _run_quiet(_PANDOC_PDF_ARGS + (input_md, "-o", tmp_pdf))
+    if returncode != 0:
+        tmp_pdf.unlink(missing_ok=True)
+        if not quiet:
+            print(f"  ✗ Error converting Markdown to PDF:", file=sys.stderr)
+            sys.stderr.writelines(stderr_tail)
         return False
 
+    os.replace(tmp_pdf, output_pdf)
+    print(f"  ✓ PDF: {output_pdf}")
+    return True
 
-def compile_tex_to_pdf(tex_file: Path, output_pdf: Path) -> bool:
-    """Compile LaTeX to PDF using latexmk.
+
+def compile_tex_to_pdf(tex_file: Path, output_pdf: Path, fast: bool = False) -> bool:
+    """Compile LaTeX to PDF using tectonic.
 
     Args:
         tex_file: Path to LaTeX file
         output_pdf: Path where PDF should be placed
+        fast: Limit tectonic to a single engine pass, skipping the
+            rerun-until-stable loop (safe for documents without
+            cross-references or a bibliography)
 
     Returns:
         True if compilation succeeded, False otherwise
@@ -230,46 +342,84 @@ def compile_tex_to_pdf(tex_file: Path, output_pdf: Path) -> bool:
     # Ensure output directory exists
     output_pdf.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create a temporary directory for compilation
+    # Create a temporary directory for compilation. Placing it next to
+    # the output PDF keeps the final rename on the same filesystem
+    # (a tmpfs /tmp would force a cross-device copy).
+    import shutil
     import tempfile
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(dir=output_pdf.parent) as tmpdir:
         tmpdir_path = Path(tmpdir)
         temp_tex = tmpdir_path / tex_file.name
 
         # Copy TEX file to temp directory
         shutil.copy(tex_file, temp_tex)
 
-        # Copy mermaid-images if they exist (created during pandoc conversion)
+        # Make mermaid-images visible if it exists (created during
+        # pandoc conversion). A symlink avoids copying every rendered
+        # diagram into the tempdir; fall back to a real copy where
+        # symlinks are unavailable (e.g. Windows without privileges).
         mermaid_src = Path.cwd() / "mermaid-images"
         if mermaid_src.exists():
             mermaid_dst = tmpdir_path / "mermaid-images"
-            shutil.copytree(mermaid_src, mermaid_dst)
+            try:
+                os.symlink(mermaid_src.resolve(), mermaid_dst, target_is_directory=True)
+            except OSError:
+                shutil.copytree(mermaid_src, mermaid_dst)
+
+        cmd = ("tectonic", "-o", tmpdir_path, temp_tex.name)
+        if fast:
+            # No reruns after the first pass
+            cmd = ("tectonic", "--reruns", "0", "-o", tmpdir_path, temp_tex.name)
+        returncode, stderr_tail = _run_quiet(cmd, cwd=tmpdir_path)
+        if returncode != 0:
+            print(f"  ✗ Error compiling LaTeX to PDF:", file=sys.stderr)
+            sys.stderr.writelines(stderr_tail)
+            return False
 
+        # Move generated PDF to final location: a plain rename on the
+        # same filesystem, with shutil.move for the cross-device case
+        temp_pdf = tmpdir_path / temp_tex.with_suffix('.pdf').name
         try:
-            result = subprocess.run(
-                [
-                    "tectonic",
-                    "-o", str(tmpdir_path),
-                    temp_tex.name
-                ],
-                cwd=tmpdir_path,
-                capture_output=True,
-                check=True
-            )
-
-            # Move generated PDF to final location
-            temp_pdf = tmpdir_path / temp_tex.with_suffix('.pdf').name
+            os.replace(temp_pdf, output_pdf)
+        except OSError:
             shutil.move(temp_pdf, output_pdf)
 
-            print(f"  ✓ PDF: {output_pdf}")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"  ✗ Error compiling LaTeX to PDF:", file=sys.stderr)
-            if e.stderr:
-                # Decode with error handling for non-UTF8 output
-                stderr_text = e.stderr.decode('utf-8', errors='replace')
-                print(stderr_text, file=sys.stderr)
-            return False
+        print(f"  ✓ PDF: {output_pdf}")
+        return True
+
+
+def copy_many_to_recent(files: list[Path], recent_dir: Path):
+    """Copy files to recent/ folder for quick access, in one batch.
+
+    PDF outputs are hardlinked instead of byte-copied: both PDF routes
+    publish with an atomic rename, so the linked inode is never
+    rewritten in place (with a real copy as the cross-filesystem
+    fallback). TEX outputs are truncated and rewritten in place by
+    pandoc, so they always get a real copy — a hardlinked recent/ copy
+    would be mutated, and corrupted on interruption, by the next build.
+
+    Args:
+        files: Source files to copy (missing files are skipped)
+        recent_dir: recent/ directory path
+    """
+    recent_dir.mkdir(parents=True, exist_ok=True)
+
+    for source_file in files:
+        if not source_file.exists():
+            continue
+
+        dest_file = recent_dir / source_file.name
+        dest_file.unlink(missing_ok=True)
+        if source_file.suffix == '.pdf':
+            try:
+                os.link(source_file, dest_file)
+            except OSError:
+                import shutil
+                shutil.copy(source_file, dest_file)
+        else:
+            import shutil
+            shutil.copy(source_file, dest_file)
+        print(f"  → recent/{source_file.name}")
 
 
 def copy_to_recent(source_file: Path, recent_dir: Path, file_type: str):
@@ -280,27 +430,29 @@ def copy_to_recent(source_file: Path, recent_dir: Path, file_type: str):
         recent_dir: recent/ directory path
         file_type: Type of file ('pdf' or 'tex')
     """
-    if not source_file.exists():
-        return
-
-    recent_dir.mkdir(parents=True, exist_ok=True)
-    dest_file = recent_dir / source_file.name
-
-    shutil.copy(source_file, dest_file)
-    print(f"  → recent/{source_file.name}")
+    copy_many_to_recent([source_file], recent_dir)
 
 
 def build_markdown_outputs(
     source_file: Path,
     mode: Literal['both', 'pdf-only', 'tex-only'],
-    repo_root: Optional[Path]
+    repo_root: Optional[Path],
+    force: bool = False,
+    fast: bool = False
 ) -> bool:
     """Build outputs from markdown source.
 
+    Outputs that are already newer than the source are skipped unless
+    force is set.
+
     Args:
         source_file: Path to markdown source file
         mode: Output mode ('both', 'pdf-only', 'tex-only')
         repo_root: Repository root (None for simple mode)
+        force: Rebuild even if outputs are up to date
+        fast: In 'both' mode, build the PDF from the TEX in a single
+            tectonic pass instead of the direct pandoc route (see
+            compile_tex_to_pdf)
 
     Returns:
         True if build succeeded, False otherwise
@@ -315,35 +467,105 @@ def build_markdown_outputs(
 
     if mode == 'pdf-only':
         # Direct MD → PDF (skip TEX)
-        if not convert_md_to_pdf_direct(source_file, paths['pdf']):
-            return False
+        if force or _needs_rebuild(source_file, paths['pdf']):
+            if not convert_md_to_pdf_direct(source_file, paths['pdf']):
+                return False
+        else:
+            print("  ✓ PDF up to date (use --force to rebuild)")
         if paths['recent']:
             copy_to_recent(paths['pdf'], paths['recent'], 'pdf')
 
     elif mode == 'tex-only':
         # MD → TEX only
-        if not convert_md_to_tex(source_file, paths['tex']):
-            return False
+        if force or _needs_rebuild(source_file, paths['tex']):
+            if not convert_md_to_tex(source_file, paths['tex']):
+                return False
+        else:
+            print("  ✓ LaTeX up to date (use --force to rebuild)")
         if paths['recent']:
             copy_to_recent(paths['tex'], paths['recent'], 'tex')
 
     else:  # mode == 'both'
-        # MD → TEX → PDF
-        if not convert_md_to_tex(source_file, paths['tex']):
+        need_tex = force or _needs_rebuild(source_file, paths['tex'])
+        need_pdf = force or _needs_rebuild(source_file, paths['pdf'])
+
+        tex_ok = pdf_ok = True
+        if not (need_tex or need_pdf):
+            print("  ✓ Outputs up to date (use --force to rebuild)")
+        elif fast:
+            # --fast routes the PDF through the TEX → tectonic compile,
+            # the only place the single-pass rerun cap applies
+            if need_tex and not convert_md_to_tex(source_file, paths['tex']):
+                return False
+            if need_pdf and not compile_tex_to_pdf(paths['tex'], paths['pdf'], fast=True):
+                return False
+        else:
+            # TEX and PDF are both derived straight from the markdown,
+            # so run the two pandoc conversions concurrently instead of
+            # serially re-parsing the document
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                tex_future = executor.submit(convert_md_to_tex, source_file, paths['tex']) if need_tex else None
+                pdf_future = executor.submit(convert_md_to_pdf_direct, source_file, paths['pdf'], True) if need_pdf else None
+                tex_ok = tex_future.result() if tex_future else True
+                pdf_ok = pdf_future.result() if pdf_future else True
+
+        if not tex_ok:
             return False
 
-        if not compile_tex_to_pdf(paths['tex'], paths['pdf']):
-            return False
+        # If the direct PDF route failed, fall back to compiling the
+        # TEX we just produced; the direct route runs quiet since this
+        # fallback covers it
+        if not pdf_ok:
+            print("  Direct PDF conversion failed, compiling from LaTeX instead")
+            if not compile_tex_to_pdf(paths['tex'], paths['pdf']):
+                return False
 
         if paths['recent']:
-            copy_to_recent(paths['tex'], paths['recent'], 'tex')
-            copy_to_recent(paths['pdf'], paths['recent'], 'pdf')
+            copy_many_to_recent([paths['tex'], paths['pdf']], paths['recent'])
 
     return True
 
 
-def main():
-    """Main entry point for the marktex CLI."""
+def _report_dependencies() -> int:
+    """Print the dependency report for --check-deps.
+
+    Returns:
+        Exit code (0 if all dependencies are installed)
+    """
+    all_found, missing = check_dependencies()
+    if all_found:
+        print("✓ All dependencies are installed!")
+        return 0
+
+    print("✗ Missing dependencies:", file=sys.stderr)
+    for dep in missing:
+        print(f"  - {dep}", file=sys.stderr)
+    return 1
+
+
+def _fast_dispatch(argv: list[str]) -> Optional[int]:
+    """Handle trivial invocations without building the argparse parser.
+
+    Args:
+        argv: Full argument vector (sys.argv)
+
+    Returns:
+        Exit code if the invocation was handled here, None otherwise
+    """
+    if argv[1:] == ["--version"]:
+        print("marktex 0.2.0")
+        return 0
+    if argv[1:] == ["--check-deps"]:
+        return _report_dependencies()
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the argument parser (cached, it is reusable across calls)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Convert Markdown files with Mermaid diagrams to LaTeX and PDF",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -366,8 +588,7 @@ Folder Organization:
 
 Requirements:
   - pandoc
-  - pandoc-mermaid filter
-  - latexmk (from texlive)
+  - tectonic
   - mermaid-cli (mmdc)
         """
     )
@@ -397,6 +618,18 @@ Requirements:
         help="Repository root for mirrored folder structure (auto-detected if not specified)"
     )
 
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild outputs even if they are newer than the source"
+    )
+
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Build the PDF from the TEX in a single LaTeX pass (skip reruns; unsafe with cross-references)"
+    )
+
     parser.add_argument(
         "--check-deps",
         action="store_true",
@@ -409,19 +642,22 @@ Requirements:
         version="marktex 0.2.0"
     )
 
+    return parser
+
+
+def main():
+    """Main entry point for the marktex CLI."""
+    # Trivial invocations skip argparse construction entirely
+    fast_result = _fast_dispatch(sys.argv)
+    if fast_result is not None:
+        return fast_result
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Check dependencies if requested
     if args.check_deps:
-        all_found, missing = check_dependencies()
-        if all_found:
-            print("✓ All dependencies are installed!")
-            return 0
-        else:
-            print("✗ Missing dependencies:", file=sys.stderr)
-            for dep in missing:
-                print(f"  - {dep}", file=sys.stderr)
-            return 1
+        return _report_dependencies()
 
     # Validate input file
     if not args.input:
@@ -477,7 +713,7 @@ Requirements:
 
     # Build outputs (Phase 1: only markdown supported)
     if source_type == 'markdown':
-        success = build_markdown_outputs(input_file, mode, repo_root)
+        success = build_markdown_outputs(input_file, mode, repo_root, force=args.force, fast=args.fast)
     # elif source_type == 'latex':  # Phase 2
     #     success = build_pdf_from_tex(input_file, repo_root)
 
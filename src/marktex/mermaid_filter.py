@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Pandoc JSON filter that renders Mermaid code blocks with caching.
+
+Drop-in replacement for the external pandoc-mermaid filter: each
+``mermaid`` code block is rendered with mmdc into mermaid-images/,
+named after the SHA-256 of the diagram source, so unchanged diagrams
+are never re-rendered across runs.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Rendered diagrams live here, relative to where pandoc was invoked;
+# compile_tex_to_pdf makes this directory visible in its build tempdir
+IMAGE_DIR = Path("mermaid-images")
+
+# The renderer is configurable for environments that must wrap or tune
+# mmdc: MARKTEX_MMDC overrides the binary, and MARKTEX_PUPPETEER_CONFIG
+# points at a puppeteer config file (CI needs --no-sandbox because
+# Chrome's sandbox does not work on GitHub runners)
+MMDC_BIN = os.environ.get("MARKTEX_MMDC", "mmdc")
+PUPPETEER_CONFIG = os.environ.get("MARKTEX_PUPPETEER_CONFIG")
+
+
+def render_mermaid(code: str) -> Optional[Path]:
+    """Render a Mermaid diagram, reusing a cached image when possible.
+
+    Args:
+        code: Mermaid diagram source
+
+    Returns:
+        Path to the rendered PNG, or None if rendering failed
+    """
+    digest = hashlib.sha256(code.encode("utf-8")).hexdigest()[:16]
+    image = IMAGE_DIR / f"{digest}.png"
+
+    # Cache hit: the image name encodes the diagram content, so an
+    # existing file is always up to date
+    if image.exists():
+        return image
+
+    IMAGE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Concurrent filter runs (both mode spawns two pandoc processes)
+    # may render the same diagram at once. Work on per-process names
+    # and publish with an atomic rename, so neither run can delete the
+    # other's input or expose a partially written PNG under the cache
+    # name; last writer wins with identical content.
+    pid = os.getpid()
+    source = IMAGE_DIR / f"{digest}.{pid}.mmd"
+    partial = IMAGE_DIR / f"{digest}.{pid}.part.png"
+    source.write_text(code, encoding="utf-8")
+    cmd = [MMDC_BIN]
+    if PUPPETEER_CONFIG:
+        cmd += ["-p", PUPPETEER_CONFIG]
+    cmd += ["-i", source, "-o", partial]
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    finally:
+        source.unlink(missing_ok=True)
+
+    if result.returncode != 0 or not partial.exists():
+        partial.unlink(missing_ok=True)
+        # Surface mmdc's complaint; pandoc forwards filter stderr
+        if result.stderr:
+            sys.stderr.write(result.stderr.decode("utf-8", errors="replace"))
+        return None
+
+    os.replace(partial, image)
+    return image
+
+
+def _walk(node):
+    """Recursively rewrite mermaid CodeBlock nodes into Image nodes.
+
+    Args:
+        node: Any piece of the pandoc AST (dict, list, or scalar)
+
+    Returns:
+        The rewritten node
+    """
+    if isinstance(node, list):
+        return [_walk(item) for item in node]
+
+    if isinstance(node, dict):
+        if node.get("t") == "CodeBlock":
+            (ident, classes, _), code = node["c"]
+            if "mermaid" in classes:
+                image = render_mermaid(code)
+                if image is not None:
+                    return {
+                        "t": "Para",
+                        "c": [{
+                            "t": "Image",
+                            "c": [[ident, [], []], [], [str(image), ""]],
+                        }],
+                    }
+                # Rendering failed: leave the code block in place, but
+                # say so — a silently missing figure is worse
+                first_line = code.strip().splitlines()[0][:60] if code.strip() else "<empty>"
+                label = ident or first_line
+                print(
+                    f"[marktex-mermaid] warning: failed to render diagram"
+                    f" ({label}); leaving code block in document",
+                    file=sys.stderr,
+                )
+        return {key: _walk(value) for key, value in node.items()}
+
+    return node
+
+
+def main():
+    """Entry point: filter a pandoc AST from stdin to stdout."""
+    doc = json.load(sys.stdin)
+    json.dump(_walk(doc), sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())